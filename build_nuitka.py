@@ -86,6 +86,7 @@ def build_nuitka():
         '--include-package=websockets',
         '--include-package=aiohttp',
         '--include-package=cryptography',
+        '--include-package=blake3',
 
         # Optimization
         '--assume-yes-for-downloads',       # Auto download dependencies
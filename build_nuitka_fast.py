@@ -76,6 +76,7 @@ def build_nuitka():
         '--include-package=websockets',
         '--include-package=aiohttp',
         '--include-package=cryptography',
+        '--include-package=blake3',
 
         # Optimization
         '--assume-yes-for-downloads',       # Auto download dependencies
@@ -14,6 +14,7 @@ from .server import ClipboardServer
 from .client import ClipboardClient
 from .tunnel import TunnelManager
 from .ui.main_window import MainWindow
+from .ui.components import HistoryRow, make_preview
 
 
 class ClipboardSyncApp:
@@ -91,28 +92,24 @@ class ClipboardSyncApp:
 
     def _start_tunnel_async(self):
         """Start tunnel in background and update UI when ready"""
-        import time
         self._log("[TUNNEL] Establishing public tunnel...")
-        self._tunnel = TunnelManager(
+        tunnel = TunnelManager(
             local_port=config.server_port,
             on_status=self._log
         )
+        self._tunnel = tunnel
 
-        # Start tunnel (non-blocking)
-        self._tunnel.start()
+        # Start tunnel (waits up to 15 seconds), then give it up to 30 more
+        tunnel_info = tunnel.start() or tunnel.wait_ready(timeout=30)
 
-        # Poll for tunnel info
-        for _ in range(60):  # Wait up to 30 seconds
-            if not self._server:  # Server stopped
-                return
-            tunnel_info = self._tunnel.info
-            if tunnel_info and "trycloudflare.com" in tunnel_info.public_url:
-                # Update UI with tunnel URL
-                url = tunnel_info.public_url
-                self._window.after(0, lambda u=url: self._window.set_server_running(True, u))
-                self._log(f"✓ Public URL: {url}")
-                return
-            time.sleep(0.5)
+        if not self._server:  # Server stopped
+            return
+        if tunnel_info and "trycloudflare.com" in tunnel_info.public_url:
+            # Update UI with tunnel URL
+            url = tunnel_info.public_url
+            self._window.after(0, lambda u=url: self._window.set_server_running(True, u))
+            self._log(f"✓ Public URL: {url}")
+            return
 
         self._log("[TUNNEL] Tunnel not ready, using local address only")
 
@@ -290,8 +287,15 @@ class ClipboardSyncApp:
 
     def _refresh_history(self):
         """Refresh history display"""
-        items = self._history.get_all(limit=50)
-        self._window.after(0, lambda: self._window.update_history(items))
+        # Format rows here so the Tk thread only has to render them
+        rows = [
+            HistoryRow(
+                item.content_hash, item.source, item.timestamp.strftime("%H:%M:%S"),
+                make_preview(item.content), item.content
+            )
+            for item in self._history.get_all(limit=50)
+        ]
+        self._window.after(0, lambda: self._window.update_history(rows))
 
     def run(self):
         """Run the application"""
@@ -158,57 +158,16 @@ class ClipboardClient:
                 self._log(f"Received message type: {msg_type}")
 
             if msg_type == 'clipboard':
-                content_type = ContentType(data.get('content_type', 'text'))
-                content_hash = data.get('content_hash', '')
-                is_compressed = data.get('compressed', False)
-
-                # Avoid echo
-                if content_hash == self._last_hash:
-                    return
-                self._last_hash = content_hash
-
-                # Create clipboard item based on content type
-                if content_type == ContentType.TEXT:
-                    content = data.get('content', '')
-                    if is_compressed and content:
-                        content = decode_and_decompress(content, True).decode('utf-8')
-                    item = ClipboardItem.from_text(content, "remote")
-                    self._log(f"Received text: {content[:30]}..." if len(content) > 30 else f"Received text: {content}")
-
-                elif content_type == ContentType.IMAGE:
-                    image_data_str = data.get('image_data', '')
-                    if image_data_str:
-                        image_data = decode_and_decompress(image_data_str, is_compressed)
-                        item = ClipboardItem.from_image(image_data, "remote")
-                        self._log(f"Received image: {len(image_data)} bytes")
-                    else:
-                        return
-
-                elif content_type == ContentType.FILES:
-                    # Check if we have actual file contents
-                    files_data = data.get('files', [])
-                    if files_data:
-                        file_contents = []
-                        total_size = 0
-                        for fd in files_data:
-                            is_file_compressed = fd.get('compressed', False)
-                            content = decode_and_decompress(fd['content'], is_file_compressed)
-                            file_contents.append(FileData(
-                                filename=fd['filename'],
-                                content=content
-                            ))
-                            total_size += len(content)
-                        item = ClipboardItem.from_file_contents(file_contents, "remote")
-                        self._log(f"Received {len(file_contents)} file(s), total: {total_size / 1024:.1f}KB")
-                    else:
-                        # Fallback: just file paths (no content)
-                        file_paths = data.get('file_paths', [])
-                        item = ClipboardItem.from_files(file_paths, "remote")
-                        self._log(f"Received file paths: {len(file_paths)} files")
-                else:
-                    return
+                item = self._parse_clipboard_message(data)
+                if item:
+                    self.on_clipboard_received(item)
 
-                self.on_clipboard_received(item)
+            elif msg_type == 'clipboard_batch':
+                # Several clipboard items coalesced into one frame by the server
+                for entry in data.get('items', []):
+                    item = self._parse_clipboard_message(entry)
+                    if item:
+                        self.on_clipboard_received(item)
 
             elif msg_type == 'pong':
                 pass  # Heartbeat response
@@ -245,6 +204,59 @@ class ClipboardClient:
             self._log(f"Message handling error: {e}")
             self._log(f"Traceback: {traceback.format_exc()}")
 
+    def _parse_clipboard_message(self, data: Dict[str, Any]) -> Optional[ClipboardItem]:
+        """Build a ClipboardItem from a 'clipboard' message, or None for echoes/empty items"""
+        content_type = ContentType(data.get('content_type', 'text'))
+        content_hash = data.get('content_hash', '')
+        is_compressed = data.get('compressed', False)
+
+        # Avoid echo
+        if content_hash == self._last_hash:
+            return None
+        self._last_hash = content_hash
+
+        # Create clipboard item based on content type
+        if content_type == ContentType.TEXT:
+            content = data.get('content', '')
+            if is_compressed and content:
+                content = decode_and_decompress(content, True).decode('utf-8')
+            item = ClipboardItem.from_text(content, "remote")
+            self._log(f"Received text: {content[:30]}..." if len(content) > 30 else f"Received text: {content}")
+
+        elif content_type == ContentType.IMAGE:
+            image_data_str = data.get('image_data', '')
+            if not image_data_str:
+                return None
+            image_data = decode_and_decompress(image_data_str, is_compressed)
+            item = ClipboardItem.from_image(image_data, "remote")
+            self._log(f"Received image: {len(image_data)} bytes")
+
+        elif content_type == ContentType.FILES:
+            # Check if we have actual file contents
+            files_data = data.get('files', [])
+            if files_data:
+                file_contents = []
+                total_size = 0
+                for fd in files_data:
+                    is_file_compressed = fd.get('compressed', False)
+                    content = decode_and_decompress(fd['content'], is_file_compressed)
+                    file_contents.append(FileData(
+                        filename=fd['filename'],
+                        content=content
+                    ))
+                    total_size += len(content)
+                item = ClipboardItem.from_file_contents(file_contents, "remote")
+                self._log(f"Received {len(file_contents)} file(s), total: {total_size / 1024:.1f}KB")
+            else:
+                # Fallback: just file paths (no content)
+                file_paths = data.get('file_paths', [])
+                item = ClipboardItem.from_files(file_paths, "remote")
+                self._log(f"Received file paths: {len(file_paths)} files")
+        else:
+            return None
+
+        return item
+
     async def _handle_chunked_init(self, data: Dict[str, Any]):
         """Handle incoming chunked transfer initialization"""
         try:
@@ -7,7 +7,6 @@ Triggers callbacks when clipboard content changes
 
 import threading
 import time
-import hashlib
 import io
 from typing import Callable, Optional, List
 from dataclasses import dataclass, field
@@ -25,6 +24,15 @@ try:
 except ImportError:
     HAS_WIN32 = False
 
+# Fast hashing for echo detection (not security relevant).
+# Required, not optional: every peer must produce the same hashes for dedup to work.
+import blake3
+
+
+def content_digest(data: bytes) -> str:
+    """Hash clipboard content (BLAKE3) for deduplication and echo detection"""
+    return blake3.blake3(data).hexdigest()
+
 
 class ContentType(Enum):
     """Clipboard content type enumeration"""
@@ -52,7 +60,7 @@ class ClipboardItem:
         image_data: Binary image data in PNG format (for IMAGE type)
         file_paths: List of file paths (for FILES type, local only)
         file_contents: List of FileData for actual file transfer
-        content_hash: MD5 hash for deduplication
+        content_hash: Content hash (BLAKE3, MD5 fallback) for deduplication
         timestamp: When the item was captured
         source: Origin of the item (local or remote)
     """
@@ -68,7 +76,7 @@ class ClipboardItem:
     @classmethod
     def from_text(cls, text: str, source: str = "local") -> 'ClipboardItem':
         """Create ClipboardItem from text content"""
-        content_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
+        content_hash = content_digest(text.encode('utf-8'))
         return cls(
             content_type=ContentType.TEXT,
             content=text,
@@ -80,7 +88,7 @@ class ClipboardItem:
     @classmethod
     def from_image(cls, image_data: bytes, source: str = "local") -> 'ClipboardItem':
         """Create ClipboardItem from image binary data (PNG format)"""
-        content_hash = hashlib.md5(image_data).hexdigest()
+        content_hash = content_digest(image_data)
         return cls(
             content_type=ContentType.IMAGE,
             image_data=image_data,
@@ -142,10 +150,10 @@ class ClipboardItem:
         # Generate hash from file contents if available, else from paths
         if file_contents:
             hash_data = b''.join(f.content for f in file_contents)
-            content_hash = hashlib.md5(hash_data).hexdigest()
+            content_hash = content_digest(hash_data)
         else:
             paths_str = '\n'.join(sorted(file_paths))
-            content_hash = hashlib.md5(paths_str.encode('utf-8')).hexdigest()
+            content_hash = content_digest(paths_str.encode('utf-8'))
 
         return cls(
             content_type=ContentType.FILES,
@@ -161,9 +169,9 @@ class ClipboardItem:
         """Create ClipboardItem from received file contents (for remote files)"""
         if file_contents:
             hash_data = b''.join(f.content for f in file_contents)
-            content_hash = hashlib.md5(hash_data).hexdigest()
+            content_hash = content_digest(hash_data)
         else:
-            content_hash = hashlib.md5(b'').hexdigest()
+            content_hash = content_digest(b'')
 
         return cls(
             content_type=ContentType.FILES,
@@ -271,7 +279,7 @@ class ClipboardMonitor:
             self._paused = True
             try:
                 pyperclip.copy(content)
-                self._last_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+                self._last_hash = content_digest(content.encode('utf-8'))
             finally:
                 self._paused = False
 
@@ -294,7 +302,7 @@ class ClipboardMonitor:
                 win32clipboard.SetClipboardData(win32con.CF_DIB, bmp_data)
                 win32clipboard.CloseClipboard()
 
-                self._last_hash = hashlib.md5(image_data).hexdigest()
+                self._last_hash = content_digest(image_data)
             except Exception:
                 pass
             finally:
@@ -354,7 +362,7 @@ class ClipboardMonitor:
                     print("[ClipboardMonitor] GlobalAlloc failed")
 
                 paths_str = '\n'.join(sorted(file_paths))
-                self._last_hash = hashlib.md5(paths_str.encode('utf-8')).hexdigest()
+                self._last_hash = content_digest(paths_str.encode('utf-8'))
             except Exception as e:
                 print(f"[ClipboardMonitor] set_files error: {e}")
                 try:
@@ -502,7 +510,7 @@ class ClipboardMonitor:
                 file_paths = self._get_clipboard_files()
                 if file_paths:
                     paths_str = '\n'.join(sorted(file_paths))
-                    content_hash = hashlib.md5(paths_str.encode('utf-8')).hexdigest()
+                    content_hash = content_digest(paths_str.encode('utf-8'))
                     if content_hash != self._last_hash:
                         self._last_hash = content_hash
                         # Read file contents for transfer, use config limits
@@ -518,7 +526,7 @@ class ClipboardMonitor:
                 if not item:
                     image_data = self._get_clipboard_image()
                     if image_data:
-                        content_hash = hashlib.md5(image_data).hexdigest()
+                        content_hash = content_digest(image_data)
                         if content_hash != self._last_hash:
                             self._last_hash = content_hash
                             item = ClipboardItem.from_image(image_data, "local")
@@ -527,7 +535,7 @@ class ClipboardMonitor:
                 if not item:
                     content = pyperclip.paste()
                     if content:
-                        content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+                        content_hash = content_digest(content.encode('utf-8'))
                         if content_hash != self._last_hash:
                             self._last_hash = content_hash
                             item = ClipboardItem.from_text(content, "local")
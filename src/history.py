@@ -13,7 +13,7 @@ from datetime import datetime
 from contextlib import contextmanager
 
 from .config import DATA_DIR
-from .clipboard_monitor import ClipboardItem, ContentType
+from .clipboard_monitor import ClipboardItem, ContentType, content_digest
 
 DB_FILE = DATA_DIR / "clipboard_history.db"
 
@@ -65,7 +65,29 @@ class HistoryManager:
                 conn.execute("ALTER TABLE clipboard_history ADD COLUMN file_paths TEXT")
             except sqlite3.OperationalError:
                 pass
+            self._migrate_md5_hashes(conn)
             conn.commit()
+
+    def _migrate_md5_hashes(self, conn):
+        """
+        Re-hash rows stored with the old 32-char MD5 content_hash as BLAKE3.
+        Only images and short texts keep their full content in the database;
+        other legacy rows (and any that collide with an existing BLAKE3 row) are dropped.
+        """
+        rows = conn.execute("""
+            SELECT id, content_type, content, image_data FROM clipboard_history
+            WHERE length(content_hash) = 32
+        """).fetchall()
+        for row in rows:
+            if row['content_type'] == ContentType.IMAGE.value and row['image_data']:
+                new_hash = content_digest(row['image_data'])
+            elif row['content_type'] in (None, ContentType.TEXT.value) and len(row['content']) <= 100:
+                new_hash = content_digest(row['content'].encode('utf-8'))
+            else:
+                continue
+            conn.execute("UPDATE OR IGNORE clipboard_history SET content_hash = ? WHERE id = ?",
+                         (new_hash, row['id']))
+        conn.execute("DELETE FROM clipboard_history WHERE length(content_hash) = 32")
     
     @contextmanager
     def _get_connection(self):
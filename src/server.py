@@ -7,10 +7,12 @@ Supports chunked transfer for large files (>10MB) with resume capability
 """
 
 import asyncio
+import concurrent.futures
 import json
+import re
 import hashlib
 import threading
-from typing import Set, Optional, Callable, Dict, Any, List
+from typing import Set, Optional, Callable, Dict, Any, List, Tuple
 from datetime import datetime
 import websockets
 from websockets.server import WebSocketServerProtocol
@@ -23,6 +25,27 @@ from .chunked_transfer import (
     needs_chunked_transfer, calculate_file_hash
 )
 
+# Delay (seconds) used to coalesce rapid clipboard changes into one batch frame
+BATCH_DELAY = 0.005
+
+# Payloads (base64 chars) above this size are decoded in the thread pool
+OFFLOAD_DECODE_SIZE = 256 * 1024
+
+# Raw payloads (bytes) above this size are compressed in the thread pool
+OFFLOAD_ENCODE_SIZE = 64 * 1024
+
+# Constant control frames, serialized once
+_PONG = json.dumps({'type': 'pong'})
+_AUTH_OK = json.dumps({'type': 'auth', 'success': True})
+_AUTH_FAIL = json.dumps({'type': 'auth', 'success': False})
+
+# Leading "type"/"transfer_id" fields of a serialized message, read without json.loads
+_HEADER_RE = re.compile(r'^\{"type":\s*"([a-z_]+)"(?:,\s*"transfer_id":\s*"([^"]*)")?')
+_FILENAME_RE = re.compile(r'"filename":\s*("(?:[^"\\]|\\.)*")')
+
+# Message types the server only forwards, so the payload never needs parsing
+_RELAY_TYPES = frozenset(('chunk_data', 'chunked_transfer_init', 'transfer_complete'))
+
 
 class ClipboardServer:
     """
@@ -63,6 +86,16 @@ class ClipboardServer:
         # Track chunked transfers: transfer_id -> (source_websocket, filename)
         self._chunked_transfers: Dict[str, tuple] = {}
 
+        # Clipboard items waiting to be broadcast as one batch
+        self._pending_items: List[ClipboardItem] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._send_tasks: Set[asyncio.Task] = set()  # In-flight _send_pending tasks
+
+        # Worker threads for zstd compression so large payloads don't stall the event loop
+        # (created per run in _run_in_thread, shut down when the loop exits)
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
     def _on_transfer_progress(self, transfer_id: str, progress: float):
         """Handle transfer progress update"""
         self.on_transfer_progress(transfer_id, progress)
@@ -95,10 +128,10 @@ class ClipboardServer:
                 auth_msg = await asyncio.wait_for(websocket.recv(), timeout=10)
                 auth_data = json.loads(auth_msg)
                 if auth_data.get('password') != config.connection_password:
-                    await websocket.send(json.dumps({'type': 'auth', 'success': False}))
+                    await websocket.send(_AUTH_FAIL)
                     await websocket.close()
                     return
-                await websocket.send(json.dumps({'type': 'auth', 'success': True}))
+                await websocket.send(_AUTH_OK)
             except Exception:
                 await websocket.close()
                 return
@@ -124,6 +157,12 @@ class ClipboardServer:
     async def _handle_message(self, websocket: WebSocketServerProtocol, message: str):
         """Handle incoming message from client"""
         try:
+            # Fast path: relay transfer messages without materializing their payload
+            header = _HEADER_RE.match(message) if isinstance(message, str) else None
+            if header and header.group(1) in _RELAY_TYPES:
+                if await self._relay_message(websocket, message, header.group(1), header.group(2)):
+                    return
+
             data = json.loads(message)
             msg_type = data.get('type')
 
@@ -132,55 +171,8 @@ class ClipboardServer:
                 self._log(f"Received message type: {msg_type}")
 
             if msg_type == 'clipboard':
-                content_type = ContentType(data.get('content_type', 'text'))
-                content_hash = data.get('content_hash', '')
-                is_compressed = data.get('compressed', False)
-
-                # Avoid echo
-                if content_hash == self._last_hash:
-                    return
-                self._last_hash = content_hash
-
-                # Create clipboard item based on content type
-                if content_type == ContentType.TEXT:
-                    content = data.get('content', '')
-                    if is_compressed and content:
-                        content = decode_and_decompress(content, True).decode('utf-8')
-                    item = ClipboardItem.from_text(content, "remote")
-                    self._log(f"Synced text: {content[:30]}..." if len(content) > 30 else f"Synced text: {content}")
-
-                elif content_type == ContentType.IMAGE:
-                    image_data_str = data.get('image_data', '')
-                    if image_data_str:
-                        image_data = decode_and_decompress(image_data_str, is_compressed)
-                        item = ClipboardItem.from_image(image_data, "remote")
-                        stats = get_compression_stats(len(image_data), len(image_data_str))
-                        self._log(f"Synced image: {len(image_data)} bytes (saved {stats['saved_percent']:.1f}%)")
-                    else:
-                        return
-
-                elif content_type == ContentType.FILES:
-                    # Check if we have actual file contents
-                    files_data = data.get('files', [])
-                    if files_data:
-                        file_contents = []
-                        total_size = 0
-                        for fd in files_data:
-                            is_file_compressed = fd.get('compressed', False)
-                            content = decode_and_decompress(fd['content'], is_file_compressed)
-                            file_contents.append(FileData(
-                                filename=fd['filename'],
-                                content=content
-                            ))
-                            total_size += len(content)
-                        item = ClipboardItem.from_file_contents(file_contents, "remote")
-                        self._log(f"Received {len(file_contents)} file(s), total: {total_size / 1024:.1f}KB")
-                    else:
-                        # Fallback: just file paths (no content)
-                        file_paths = data.get('file_paths', [])
-                        item = ClipboardItem.from_files(file_paths, "remote")
-                        self._log(f"Received file paths: {len(file_paths)} files")
-                else:
+                item = await self._parse_clipboard_message(data)
+                if not item:
                     return
 
                 self.on_clipboard_received(item)
@@ -188,8 +180,21 @@ class ClipboardServer:
                 # Broadcast to other clients
                 await self._broadcast(data, exclude=websocket)
 
+            elif msg_type == 'clipboard_batch':
+                # Several clipboard items coalesced into one frame
+                received = False
+                for entry in data.get('items', []):
+                    item = await self._parse_clipboard_message(entry)
+                    if item:
+                        self.on_clipboard_received(item)
+                        received = True
+
+                # Relay the whole batch to other clients
+                if received:
+                    await self._broadcast(data, exclude=websocket)
+
             elif msg_type == 'ping':
-                await websocket.send(json.dumps({'type': 'pong'}))
+                await websocket.send(_PONG)
 
             # === Chunked transfer messages - relay between clients ===
             elif msg_type == 'chunked_transfer_init':
@@ -287,9 +292,107 @@ class ClipboardServer:
             self._log(f"Message handling error: {e}")
             self._log(f"Traceback: {traceback.format_exc()}")
     
+    async def _parse_clipboard_message(self, data: Dict[str, Any]) -> Optional[ClipboardItem]:
+        """Build a ClipboardItem from a 'clipboard' message, or None for echoes/empty items"""
+        content_type = ContentType(data.get('content_type', 'text'))
+        content_hash = data.get('content_hash', '')
+        is_compressed = data.get('compressed', False)
+
+        # Avoid echo
+        if content_hash == self._last_hash:
+            return None
+        self._last_hash = content_hash
+
+        # Create clipboard item based on content type
+        if content_type == ContentType.TEXT:
+            content = data.get('content', '')
+            if is_compressed and content:
+                content = (await self._decode(content, True)).decode('utf-8')
+            item = ClipboardItem.from_text(content, "remote")
+            self._log(f"Synced text: {content[:30]}..." if len(content) > 30 else f"Synced text: {content}")
+
+        elif content_type == ContentType.IMAGE:
+            image_data_str = data.get('image_data', '')
+            if not image_data_str:
+                return None
+            image_data = await self._decode(image_data_str, is_compressed)
+            item = ClipboardItem.from_image(image_data, "remote")
+            stats = get_compression_stats(len(image_data), len(image_data_str))
+            self._log(f"Synced image: {len(image_data)} bytes (saved {stats['saved_percent']:.1f}%)")
+
+        elif content_type == ContentType.FILES:
+            # Check if we have actual file contents
+            files_data = data.get('files', [])
+            if files_data:
+                file_contents = []
+                total_size = 0
+                for fd in files_data:
+                    is_file_compressed = fd.get('compressed', False)
+                    content = await self._decode(fd['content'], is_file_compressed)
+                    file_contents.append(FileData(
+                        filename=fd['filename'],
+                        content=content
+                    ))
+                    total_size += len(content)
+                item = ClipboardItem.from_file_contents(file_contents, "remote")
+                self._log(f"Received {len(file_contents)} file(s), total: {total_size / 1024:.1f}KB")
+            else:
+                # Fallback: just file paths (no content)
+                file_paths = data.get('file_paths', [])
+                item = ClipboardItem.from_files(file_paths, "remote")
+                self._log(f"Received file paths: {len(file_paths)} files")
+        else:
+            return None
+
+        return item
+
+    async def _encode(self, data: bytes) -> Tuple[str, bool]:
+        """Compress and base64-encode data, offloading large payloads to the worker pool"""
+        if len(data) < OFFLOAD_ENCODE_SIZE:
+            return compress_and_encode(data)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, compress_and_encode, data)
+
+    async def _decode(self, data_str: str, is_compressed: bool) -> bytes:
+        """Decode and decompress data, offloading large payloads to the worker pool"""
+        if len(data_str) < OFFLOAD_DECODE_SIZE:
+            return decode_and_decompress(data_str, is_compressed)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, decode_and_decompress, data_str, is_compressed)
+
+    async def _relay_message(self, websocket: WebSocketServerProtocol, message: str,
+                             msg_type: str, transfer_id: Optional[str]) -> bool:
+        """
+        Relay a transfer message using only its header fields.
+        Returns False if the header is incomplete and the message needs a full parse.
+        """
+        if not transfer_id:
+            return False
+
+        filename = None
+        if msg_type == 'chunked_transfer_init':
+            match = _FILENAME_RE.search(message)
+            if not match:
+                return False
+            filename = json.loads(match.group(1))
+
+        self._log(f"Received message type: {msg_type}")
+
+        if msg_type == 'chunked_transfer_init':
+            self._chunked_transfers[transfer_id] = (websocket, filename)
+            self._log(f"Relaying chunked transfer init: {filename}")
+        elif msg_type == 'transfer_complete':
+            self._chunked_transfers.pop(transfer_id, None)
+
+        await self._broadcast_raw(message, exclude=websocket)
+        return True
+
     async def _broadcast(self, data: Dict[str, Any], exclude: Optional[WebSocketServerProtocol] = None):
         """Broadcast message to all clients"""
-        message = json.dumps(data)
+        await self._broadcast_raw(json.dumps(data), exclude=exclude)
+
+    async def _broadcast_raw(self, message: str, exclude: Optional[WebSocketServerProtocol] = None):
+        """Broadcast an already serialized message to all clients"""
         for client in self._clients.copy():
             if client != exclude:
                 try:
@@ -298,11 +401,71 @@ class ClipboardServer:
                     self._clients.discard(client)
     
     async def broadcast_clipboard_item(self, item: ClipboardItem):
-        """Broadcast clipboard item to all clients with compression"""
+        """Queue clipboard item for broadcast; bursts are coalesced into one batch frame"""
         if item.content_hash == self._last_hash:
             return
         self._last_hash = item.content_hash
 
+        self._pending_items.append(item)
+        if self._flush_handle is None:
+            loop = asyncio.get_event_loop()
+            self._flush_handle = loop.call_later(BATCH_DELAY, self._flush_pending)
+
+    def _flush_pending(self):
+        """Timer callback - hand the queued items to a send task"""
+        self._flush_handle = None
+        items, self._pending_items = self._pending_items, []
+        if items:
+            # Chain onto the previous send so frames go out in the order items were queued
+            self._flush_task = asyncio.ensure_future(self._send_pending(items, self._flush_task))
+            self._send_tasks.add(self._flush_task)
+            self._flush_task.add_done_callback(self._send_tasks.discard)
+
+    def _cancel_pending_sends(self):
+        """Drop queued broadcasts and wind down in-flight send tasks (loop thread, loop stopped)"""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_items.clear()
+        tasks = [task for task in self._send_tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._flush_task = None
+
+    async def _send_pending(self, items: List[ClipboardItem], previous: Optional[asyncio.Task] = None):
+        """Broadcast queued clipboard items, as a single frame when there are several"""
+        # Collapse duplicates, keeping each hash at the position of its last occurrence
+        unique = list({item.content_hash: item for item in reversed(items)}.values())[::-1]
+
+        messages = []
+        large_files: List[FileData] = []
+        for item in unique:
+            data, item_large_files = await self._build_clipboard_message(item)
+            if data:
+                messages.append(data)
+            large_files.extend(item_large_files)
+
+        # Encoding may overlap with the previous batch, sending must not
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        if len(messages) == 1:
+            await self._broadcast(messages[0])
+        elif messages:
+            self._log(f"Sending {len(messages)} clipboard items in one batch")
+            await self._broadcast({'type': 'clipboard_batch', 'items': messages})
+
+        # Send large files via chunked transfer
+        for file_data in large_files:
+            await self._broadcast_large_file(file_data)
+
+    async def _build_clipboard_message(self, item: ClipboardItem) -> Tuple[Optional[Dict[str, Any]], List[FileData]]:
+        """
+        Build the 'clipboard' message for an item with compression.
+        Returns (message or None, large files that need chunked transfer).
+        """
         data = {
             'type': 'clipboard',
             'content_type': item.content_type.value,
@@ -314,7 +477,7 @@ class ClipboardServer:
         if item.content_type == ContentType.TEXT:
             content_bytes = item.content.encode('utf-8')
             if len(content_bytes) > 512:
-                encoded, is_compressed = compress_and_encode(content_bytes)
+                encoded, is_compressed = await self._encode(content_bytes)
                 data['content'] = encoded
                 data['compressed'] = is_compressed
                 if is_compressed:
@@ -324,7 +487,7 @@ class ClipboardServer:
                 data['content'] = item.content
 
         elif item.content_type == ContentType.IMAGE:
-            encoded, is_compressed = compress_and_encode(item.image_data)
+            encoded, is_compressed = await self._encode(item.image_data)
             data['image_data'] = encoded
             data['compressed'] = is_compressed
             stats = get_compression_stats(len(item.image_data), len(encoded))
@@ -342,34 +505,30 @@ class ClipboardServer:
                     else:
                         small_files.append(file_data)
 
+                if not small_files:
+                    return None, large_files
+
                 # Send small files normally
-                if small_files:
-                    files_data = []
-                    total_size = 0
-                    for file_data in small_files:
-                        encoded, is_compressed = compress_and_encode(file_data.content)
-                        files_data.append({
-                            'filename': file_data.filename,
-                            'content': encoded,
-                            'compressed': is_compressed,
-                            'size': len(file_data.content)
-                        })
-                        total_size += len(file_data.content)
-                    data['files'] = files_data
-                    data['file_count'] = len(files_data)
-                    self._log(f"Sending {len(files_data)} small file(s), total: {total_size / 1024:.1f}KB")
-                    await self._broadcast(data)
-
-                # Send large files via chunked transfer
-                for file_data in large_files:
-                    await self._broadcast_large_file(file_data)
-
-                return  # Already sent above
+                files_data = []
+                total_size = 0
+                for file_data in small_files:
+                    encoded, is_compressed = await self._encode(file_data.content)
+                    files_data.append({
+                        'filename': file_data.filename,
+                        'content': encoded,
+                        'compressed': is_compressed,
+                        'size': len(file_data.content)
+                    })
+                    total_size += len(file_data.content)
+                data['files'] = files_data
+                data['file_count'] = len(files_data)
+                self._log(f"Sending {len(files_data)} small file(s), total: {total_size / 1024:.1f}KB")
+                return data, large_files
             else:
                 # Fallback to just paths (for local-only use)
                 data['file_paths'] = item.file_paths
 
-        await self._broadcast(data)
+        return data, []
 
     async def _broadcast_large_file(self, file_data: FileData):
         """Broadcast a large file using chunked transfer"""
@@ -527,11 +686,15 @@ class ClipboardServer:
         """Run asyncio event loop in thread"""
         self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
         try:
             self._loop.run_until_complete(self._run_server())
         except Exception as e:
             self._log(f"Server error: {e}")
         finally:
+            # Nothing may reach the executor after it is shut down
+            self._cancel_pending_sends()
+            self._executor.shutdown(wait=False)
             self._loop.close()
     
     def stop(self):
@@ -52,6 +52,13 @@ def create_icon_image(size: int = 64, color: str = "#00ff9f") -> Image.Image:
     return image
 
 
+# Pre-rendered icons for the two server states
+ICON_COLOR_ACTIVE = "#00ff9f"
+ICON_COLOR_IDLE = "#ff0050"
+_ICON_ACTIVE = create_icon_image(color=ICON_COLOR_ACTIVE)
+_ICON_IDLE = create_icon_image(color=ICON_COLOR_IDLE)
+
+
 class TrayIcon:
     """
     System tray icon with menu.
@@ -84,7 +91,7 @@ class TrayIcon:
     
     def _run(self):
         """Run tray icon"""
-        image = create_icon_image()
+        image = _ICON_ACTIVE
         
         menu = pystray.Menu(
             Item("Show Window", lambda: self.on_show(), default=True),
@@ -117,6 +124,5 @@ class TrayIcon:
         """Update icon to reflect server status"""
         self._server_running = server_running
         if self._icon:
-            color = "#00ff9f" if server_running else "#ff0050"
-            self._icon.icon = create_icon_image(color=color)
+            self._icon.icon = _ICON_ACTIVE if server_running else _ICON_IDLE
 
@@ -7,16 +7,19 @@ Automatically downloads cloudflared if not present.
 
 import subprocess
 import threading
+import selectors
 import re
 import time
 import socket
 import os
 import sys
 import shutil
+import atexit
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, ClassVar
 from dataclasses import dataclass
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 
 @dataclass
@@ -35,6 +38,23 @@ CLOUDFLARED_URLS = {
     "linux": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64"
 }
 
+# Sanity check for downloads - real cloudflared builds are tens of MB
+MIN_CLOUDFLARED_SIZE = 1024 * 1024
+
+# Shared HTTP session so repeated downloads/checks reuse connections
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+atexit.register(_session.close)
+
+# Quick tunnel URL printed by cloudflared
+_TRYCF_RE = re.compile(r'https://[a-zA-Z0-9-]+\.trycloudflare\.com')
+
 
 def get_app_dir() -> Path:
     """Get application data directory"""
@@ -47,12 +67,51 @@ def get_app_dir() -> Path:
     return app_dir
 
 
+# Cached local IP - refreshed after LOCAL_IP_TTL seconds so interface changes propagate
+LOCAL_IP_TTL = 60
+_local_ip_cache = {"ip": None, "ts": 0.0}
+
+
+def _probe_local_ip(family: int, target: tuple) -> Optional[str]:
+    """Source address the OS would use to reach target (UDP connect sends no packets)"""
+    s = None
+    try:
+        s = socket.socket(family, socket.SOCK_DGRAM)
+        s.connect(target)
+        return s.getsockname()[0]
+    except OSError:
+        return None
+    finally:
+        if s is not None:
+            s.close()
+
+
+def get_local_ip() -> str:
+    """Get local IP address (cached), falling back to IPv6 on IPv6-only hosts"""
+    now = time.time()
+    if _local_ip_cache["ip"] and now - _local_ip_cache["ts"] < LOCAL_IP_TTL:
+        return _local_ip_cache["ip"]
+
+    ip = (_probe_local_ip(socket.AF_INET, ("8.8.8.8", 80))
+          or _probe_local_ip(socket.AF_INET6, ("2001:4860:4860::8888", 80)))
+    if not ip:
+        return "127.0.0.1"
+
+    _local_ip_cache["ip"] = ip
+    _local_ip_cache["ts"] = now
+    return ip
+
+
 class TunnelManager:
     """
     Manages Cloudflare Tunnel for exposing local server to internet.
     Automatically downloads and manages cloudflared binary.
     """
 
+    # Resolved cloudflared binary, shared by all instances
+    _cached_cloudflared: ClassVar[Optional[Path]] = None
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, local_port: int, on_status: Optional[Callable[[str], None]] = None):
         self.local_port = local_port
         self.on_status = on_status or (lambda _: None)
@@ -61,13 +120,25 @@ class TunnelManager:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._cloudflared_path: Optional[Path] = None
+        self._ready = threading.Event()  # Set once _tunnel_info is available
 
     def _log(self, message: str):
         """Log status message"""
         self.on_status(message)
 
     def _get_cloudflared_path(self) -> Optional[Path]:
-        """Get path to cloudflared binary, download if needed"""
+        """Get path to cloudflared binary (cached per process)"""
+        with TunnelManager._cache_lock:
+            cached = TunnelManager._cached_cloudflared
+            if cached and cached.exists():
+                return cached
+
+            path = self._resolve_cloudflared_path()
+            TunnelManager._cached_cloudflared = path
+            return path
+
+    def _resolve_cloudflared_path(self) -> Optional[Path]:
+        """Locate cloudflared binary, download if needed"""
         app_dir = get_app_dir()
 
         if sys.platform == "win32":
@@ -76,41 +147,65 @@ class TunnelManager:
             binary_name = "cloudflared"
 
         binary_path = app_dir / binary_name
+        etag_path = app_dir / "cloudflared.etag"
+        url = CLOUDFLARED_URLS.get(sys.platform)
 
-        # Check if already exists
+        # Check if already exists and matches the latest release
         if binary_path.exists():
-            return binary_path
-
-        # Check if in PATH
-        which_result = shutil.which("cloudflared")
-        if which_result:
-            return Path(which_result)
+            if not url or self._is_cloudflared_current(url, etag_path):
+                return binary_path
+            self._log("[TUNNEL] cloudflared update available")
+        else:
+            # Check if in PATH
+            which_result = shutil.which("cloudflared")
+            if which_result:
+                return Path(which_result)
 
         # Download cloudflared
         self._log("[TUNNEL] Downloading cloudflared...")
         try:
-            url = CLOUDFLARED_URLS.get(sys.platform)
             if not url:
                 self._log(f"[TUNNEL] Unsupported platform: {sys.platform}")
                 return None
 
-            response = requests.get(url, stream=True, timeout=60)
-            response.raise_for_status()
+            # Download to a temp file and rename, so a failed download is never reused
+            tmp_path = binary_path.with_suffix(binary_path.suffix + '.part')
+            with _session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                remote_etag = response.headers.get("ETag", "")
+                response.raw.decode_content = True
+                with open(tmp_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
 
-            with open(binary_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            if tmp_path.stat().st_size < MIN_CLOUDFLARED_SIZE:
+                tmp_path.unlink()
+                self._log("[TUNNEL] Downloaded cloudflared is too small, discarding")
+                return binary_path if binary_path.exists() else None
 
             # Make executable on Unix
             if sys.platform != "win32":
-                os.chmod(binary_path, 0o755)
+                os.chmod(tmp_path, 0o755)
+
+            os.replace(tmp_path, binary_path)
+            etag_path.write_text(remote_etag)
 
             self._log("[TUNNEL] cloudflared downloaded successfully")
             return binary_path
 
         except Exception as e:
             self._log(f"[TUNNEL] Failed to download cloudflared: {e}")
-            return None
+            return binary_path if binary_path.exists() else None
+
+    def _is_cloudflared_current(self, url: str, etag_path: Path) -> bool:
+        """Compare the release ETag with the one saved at download time"""
+        try:
+            head = _session.head(url, timeout=5, allow_redirects=True)
+            remote_etag = head.headers.get("ETag", "")
+        except requests.RequestException:
+            return True  # Offline: keep using the existing binary
+
+        local_etag = etag_path.read_text() if etag_path.exists() else ""
+        return not remote_etag or remote_etag == local_etag
 
     def start(self) -> Optional[TunnelInfo]:
         """Start tunnel and return connection info"""
@@ -118,6 +213,7 @@ class TunnelManager:
             return self._tunnel_info
 
         self._running = True
+        self._ready.clear()
 
         # Get cloudflared binary
         self._cloudflared_path = self._get_cloudflared_path()
@@ -126,77 +222,103 @@ class TunnelManager:
             return self._fallback_local()
 
         # Start tunnel in background thread
-        self._thread = threading.Thread(target=self._run_tunnel, daemon=True)
+        self._thread = threading.Thread(target=self._run_tunnel, name='tunnel', daemon=True)
         self._thread.start()
 
         # Wait for tunnel to establish (max 15 seconds)
-        for _ in range(30):
-            if self._tunnel_info:
-                return self._tunnel_info
-            time.sleep(0.5)
+        if self._ready.wait(timeout=15):
+            return self._tunnel_info
 
         # Return None to indicate still connecting
         return None
 
     def _run_tunnel(self):
         """Run cloudflared tunnel"""
-        try:
-            self._log("[TUNNEL] Starting Cloudflare Tunnel...")
+        self._log("[TUNNEL] Starting Cloudflare Tunnel...")
 
-            # Start cloudflared with quick tunnel
+        # Start cloudflared with quick tunnel
+        # cloudflared writes its log (including the tunnel URL) to stderr
+        try:
             self._process = subprocess.Popen(
                 [str(self._cloudflared_path), 'tunnel', '--url', f'http://localhost:{self.local_port}'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                bufsize=1,
                 text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+                encoding='utf-8',
+                errors='replace',
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
             )
-
-            # Read output to find tunnel URL
-            while self._running and self._process.poll() is None:
-                line = self._process.stdout.readline()
-                if not line:
-                    continue
-
-                # Look for tunnel URL in output
-                # Format: "... https://xxxxx.trycloudflare.com ..."
-                match = re.search(r'https://[a-zA-Z0-9-]+\.trycloudflare\.com', line)
-                if match:
-                    https_url = match.group(0)
-                    # Convert to WSS for WebSocket
-                    wss_url = https_url.replace('https://', 'wss://')
-
-                    self._tunnel_info = TunnelInfo(
-                        public_url=wss_url,
-                        local_port=self.local_port,
-                        provider="Cloudflare"
-                    )
-                    self._log(f"[TUNNEL] Connected: {wss_url}")
-
-        except Exception as e:
+        except (OSError, subprocess.SubprocessError) as e:
             self._log(f"[TUNNEL] Error: {e}")
+            return
+
+        # Read log output to find tunnel URL
+        lines = self._iter_output_lines(self._process.stderr)
+        for line in lines:
+            if 'trycloudflare.com' not in line:
+                continue
+
+            # Look for tunnel URL in output
+            # Format: "... https://xxxxx.trycloudflare.com ..."
+            match = _TRYCF_RE.search(line)
+            if match:
+                https_url = match.group(0)
+                # Convert to WSS for WebSocket
+                wss_url = https_url.replace('https://', 'wss://')
+
+                self._tunnel_info = TunnelInfo(
+                    public_url=wss_url,
+                    local_port=self.local_port,
+                    provider="Cloudflare"
+                )
+                self._log(f"[TUNNEL] Connected: {wss_url}")
+                self._ready.set()
+                break
+
+        # Keep draining output so cloudflared never blocks on a full pipe
+        for _ in lines:
+            pass
+
+    def _iter_output_lines(self, stream):
+        """Yield output lines from a process pipe until EOF or stop()"""
+        if sys.platform == "win32":
+            # selectors can only wait on sockets on Windows, fall back to blocking reads
+            for line in iter(stream.readline, ''):
+                if not self._running:
+                    return
+                yield line
+            return
+
+        fd = stream.fileno()
+        os.set_blocking(fd, False)
+        buffer = b''
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while self._running:
+                if not selector.select(timeout=0.25):
+                    continue
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break  # EOF - process exited
+                buffer += chunk
+                *complete, buffer = buffer.split(b'\n')
+                for line in complete:
+                    yield line.decode('utf-8', errors='replace')
 
     def _fallback_local(self) -> TunnelInfo:
         """Fallback to local IP"""
-        local_ip = self._get_local_ip()
+        local_ip = get_local_ip()
+        if ":" in local_ip:
+            local_ip = f"[{local_ip}]"  # IPv6 literal in a URL
         self._tunnel_info = TunnelInfo(
             public_url=f"ws://{local_ip}:{self.local_port}",
             local_port=self.local_port,
             provider="local"
         )
+        self._ready.set()
         return self._tunnel_info
 
-    def _get_local_ip(self) -> str:
-        """Get local IP address"""
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception:
-            return "127.0.0.1"
-
     def stop(self):
         """Stop tunnel"""
         self._running = False
@@ -207,10 +329,21 @@ class TunnelManager:
             except subprocess.TimeoutExpired:
                 self._process.kill()
             self._process = None
+        if self._thread:
+            self._thread.join(timeout=5)
+            if self._thread.is_alive():
+                self._log("[TUNNEL] Monitor did not exit in time")
+            self._thread = None
         if self._tunnel_info:
             self._tunnel_info.active = False
+        self._ready.set()  # Wake anyone still waiting for the URL
         self._log("[TUNNEL] Stopped")
 
+    def wait_ready(self, timeout: Optional[float] = None) -> Optional[TunnelInfo]:
+        """Block until the tunnel URL is known or stop() is called"""
+        self._ready.wait(timeout)
+        return self._tunnel_info
+
     @property
     def info(self) -> Optional[TunnelInfo]:
         """Get current tunnel info"""
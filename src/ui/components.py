@@ -5,66 +5,149 @@ Reusable widgets for the clipboard sync application
 """
 
 import customtkinter as ctk
+from collections import deque, namedtuple
+from itertools import islice
 from typing import Callable, Optional
-from .theme import theme
+from .theme import theme, fonts
+
+# Source tag text and color for history cards
+_SOURCE_STYLE = {
+    "remote": ("[REMOTE]", theme.accent_cyan),
+    "local": ("[LOCAL]", theme.accent_green),
+}
+
+# Frame styling shared by every history card, resolved from the theme once
+_CARD_FRAME_STYLE = {
+    "fg_color": theme.bg_light,
+    "border_width": 1,
+    "border_color": theme.border_default,
+    "corner_radius": theme.corner_radius,
+}
+
+# Pre-formatted history entry, built off the Tk thread and rendered as-is
+HistoryRow = namedtuple("HistoryRow", "hash source ts_str preview content")
+
+# Newline scrub for single-line previews, applied in one pass
+_NL_TABLE = str.maketrans({"\n": " ↵ ", "\r": ""})
+
+
+def make_preview(content: str, limit: int = 100) -> str:
+    """Single-line preview of clipboard content for history cards"""
+    preview = (content[:limit] + "...") if len(content) > limit else content
+    return preview.translate(_NL_TABLE)
 
 
 class TerminalLog(ctk.CTkTextbox):
     """Terminal-style log display widget"""
 
+    # Autoscroll only while the view ends within this fraction of the bottom
+    AUTOSCROLL_THRESHOLD = 0.98
+
     def __init__(self, master, **kwargs):
         super().__init__(
             master,
             fg_color=theme.bg_dark,
             text_color=theme.accent_green,
-            font=(theme.font_mono, theme.font_size_normal),
+            font=fonts.mono_normal,
             border_width=1,
             border_color=theme.border_default,
             corner_radius=theme.corner_radius,
             **kwargs
         )
         self.configure(state="disabled")
-        self._line_count = 0
         self._max_lines = 500
 
+        # Ring buffer of log lines (source of truth); only new lines are inserted on flush
+        self._buffer: deque = deque(maxlen=self._max_lines)
+        self._unflushed = 0  # Lines at the end of _buffer not yet in the widget
+        self._shown = 0  # Lines currently in the widget
+        self._dirty = False
+
     def append(self, text: str, color: str = None):
-        """Append text to the log"""
+        """Append text to the log (batched until the next idle tick)"""
+        self._buffer.append(f"❯ {text}")
+        self._unflushed = min(self._unflushed + 1, self._max_lines)
+        if not self._dirty:
+            self._dirty = True
+            self.after_idle(self._flush)
+
+    def _flush(self):
+        """Insert lines added since the last flush and trim overflow from the top"""
+        self._dirty = False
+        count, self._unflushed = self._unflushed, 0
+        if not count:
+            return
+        text = "\n".join(islice(self._buffer, len(self._buffer) - count, None))
+        if self._shown:
+            text = "\n" + text
+
+        # Only follow new output if the user hasn't scrolled up (tail -f style)
+        _, last = self.yview()
+        following = last >= self.AUTOSCROLL_THRESHOLD
+        top_line = 0 if following else int(self.index("@0,0").split(".")[0])
         self.configure(state="normal")
-
-        # Add newline if not first line
-        if self._line_count > 0:
-            self.insert("end", "\n")
-
-        # Insert text
-        self.insert("end", f"❯ {text}")
-        self._line_count += 1
-
-        # Trim old lines
-        if self._line_count > self._max_lines:
-            self.delete("1.0", "2.0")
-            self._line_count -= 1
-
+        self.insert("end-1c", text)
+        self._shown += count
+        overflow = self._shown - self._max_lines
+        if overflow > 0:
+            self.delete("1.0", f"{overflow + 1}.0")
+            self._shown -= overflow
+            if not following:
+                # Keep the same text at the top of the view after lines above it are dropped
+                self.yview(f"{max(top_line - overflow, 1)}.0")
         self.configure(state="disabled")
-        self.see("end")
+        if following:
+            self.see("end")
 
     def clear(self):
         """Clear the log"""
+        self._buffer.clear()
+        self._unflushed = self._shown = 0
         self.configure(state="normal")
         self.delete("1.0", "end")
-        self._line_count = 0
         self.configure(state="disabled")
 
 
+class StatusModel:
+    """Single status value shared by several StatusIndicator views"""
+
+    def __init__(self):
+        self._subs = []
+        self.status: Optional[str] = None
+        self.label_short: Optional[str] = None
+        self.label_long: Optional[str] = None
+
+    def subscribe(self, callback: Callable[["StatusModel"], None]):
+        """Call callback with this model on every change"""
+        self._subs.append(callback)
+
+    def set(self, status: str, label_short: str, label_long: Optional[str] = None):
+        """Update the status and push it to all subscribers"""
+        self.status = status
+        self.label_short = label_short
+        self.label_long = label_long or label_short
+        for callback in self._subs:
+            callback(self)
+
+
 class StatusIndicator(ctk.CTkFrame):
     """Status indicator with pulsing dot and label"""
 
+    _STATUS_COLORS = {
+        "online": theme.accent_green,
+        "offline": theme.accent_red,
+        "connecting": theme.accent_orange,
+        "syncing": theme.accent_cyan,
+        "waiting": theme.accent_purple
+    }
+
     def __init__(self, master, label: str = "Status", **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
 
         self._dot = ctk.CTkLabel(
             self,
             text="●",
-            font=(theme.font_mono, 14),
+            font=fonts.mono_large,
             text_color=theme.text_muted,
             width=20
         )
@@ -73,25 +156,33 @@ class StatusIndicator(ctk.CTkFrame):
         self._label = ctk.CTkLabel(
             self,
             text=label,
-            font=(theme.font_mono, theme.font_size_normal),
+            font=fonts.mono_normal,
             text_color=theme.text_secondary
         )
         self._label.pack(side="left")
 
         self._status = "offline"
+        self._last = (None, None)  # Last (status, label) applied, repeats are no-ops
         self._blinking = False
+        self._blink_id = None
+        self._blink_state = False  # True while the dot shows the hollow frame
+
+        # Track whether the window is iconified from Map/Unmap events, so _blink needs no Tcl query
+        self._window_visible = True
+        self._toplevel = self.winfo_toplevel()
+        self._map_bindings = (
+            ("<Map>", self._toplevel.bind("<Map>", lambda e: self._on_toplevel_map(e, True), add="+")),
+            ("<Unmap>", self._toplevel.bind("<Unmap>", lambda e: self._on_toplevel_map(e, False), add="+")),
+        )
 
     def set_status(self, status: str, label: str = None):
-        """Update status indicator"""
-        colors = {
-            "online": theme.accent_green,
-            "offline": theme.accent_red,
-            "connecting": theme.accent_orange,
-            "syncing": theme.accent_cyan,
-            "waiting": theme.accent_purple
-        }
+        """Update status indicator (no-op if unchanged)"""
+        key = (status, label)
+        if key == self._last:
+            return
+        self._last = key
         self._status = status
-        self._dot.configure(text_color=colors.get(status, theme.text_muted))
+        self._dot.configure(text_color=self._STATUS_COLORS.get(status, theme.text_muted))
         if label:
             self._label.configure(text=label)
 
@@ -101,14 +192,49 @@ class StatusIndicator(ctk.CTkFrame):
             self._blink()
         elif status != "connecting":
             self._blinking = False
+            self._cancel_blink()
+            if self._blink_state:
+                self._blink_state = False
+                self._dot.configure(text="●")
+
+    def attach(self, model: StatusModel, detail: bool = False):
+        """Follow a shared StatusModel, showing its long label if detail is set"""
+        if detail:
+            model.subscribe(lambda m: self.set_status(m.status, m.label_long))
+        else:
+            model.subscribe(lambda m: self.set_status(m.status, m.label_short))
 
     def _blink(self):
         """Blink animation for connecting state"""
         if not self._blinking:
+            self._blink_id = None
             return
-        current = self._dot.cget("text")
-        self._dot.configure(text="○" if current == "●" else "●")
-        self.after(500, self._blink)
+        # Skip the repaint while the window is iconified but keep the timer alive
+        if self._window_visible:
+            self._blink_state = not self._blink_state
+            self._dot.configure(text="○" if self._blink_state else "●")
+        self._blink_id = self.after(500, self._blink)
+
+    def _on_toplevel_map(self, event, visible: bool):
+        # Toplevel bindings also see events from child widgets; only the window itself counts
+        if event.widget is self._toplevel:
+            self._window_visible = visible
+
+    def _cancel_blink(self):
+        """Cancel the pending blink timer, if any"""
+        if self._blink_id:
+            self.after_cancel(self._blink_id)
+            self._blink_id = None
+
+    def destroy(self):
+        self._cancel_blink()
+        # Remove only our own toplevel bindings; Misc.unbind() would clear the whole sequence
+        for sequence, funcid in self._map_bindings:
+            script = self._toplevel.bind(sequence)
+            kept = [line for line in script.splitlines() if funcid not in line]
+            self._toplevel.bind(sequence, "\n".join(kept))
+            self._toplevel.deletecommand(funcid)
+        super().destroy()
 
 
 class GlowButton(ctk.CTkButton):
@@ -119,7 +245,7 @@ class GlowButton(ctk.CTkButton):
         super().__init__(
             master,
             text=text,
-            font=(theme.font_mono, theme.font_size_normal, "bold"),
+            font=fonts.mono_normal_bold,
             fg_color="transparent",
             hover_color=theme.bg_hover,
             border_width=1,
@@ -133,66 +259,116 @@ class GlowButton(ctk.CTkButton):
 class ClipboardCard(ctk.CTkFrame):
     """Card displaying clipboard history item"""
 
+    # Fixed card heights (with / without the action row). Children must fit in
+    # these; geometry propagation is off so cards never trigger a reflow.
+    HEIGHT = 104
+    HEIGHT_NO_ACTIONS = 72
+
     def __init__(self, master, content: str, timestamp: str, source: str,
-                 on_copy: Callable[[], None] = None, on_delete: Callable[[], None] = None, **kwargs):
+                 on_copy: Callable[[], None] = None, on_delete: Callable[[], None] = None,
+                 preview: Optional[str] = None, content_hash: Optional[str] = None, **kwargs):
         super().__init__(
             master,
-            fg_color=theme.bg_light,
-            border_width=1,
-            border_color=theme.border_default,
-            corner_radius=theme.corner_radius,
+            height=self.HEIGHT if on_copy or on_delete else self.HEIGHT_NO_ACTIONS,
+            **_CARD_FRAME_STYLE,
             **kwargs
         )
+        self.grid_propagate(False)
 
-        # Header with timestamp and source
-        header = ctk.CTkFrame(self, fg_color="transparent")
-        header.pack(fill="x", padx=10, pady=(8, 4))
-
-        source_color = theme.accent_cyan if source == "remote" else theme.accent_green
-        ctk.CTkLabel(
-            header,
-            text=f"[{source.upper()}]",
-            font=(theme.font_mono, theme.font_size_small),
-            text_color=source_color
-        ).pack(side="left")
-
-        ctk.CTkLabel(
-            header,
-            text=timestamp,
-            font=(theme.font_mono, theme.font_size_small),
+        # Laid out with grid directly on the card to avoid nested row frames
+        self.grid_columnconfigure(0, weight=1)
+
+        # Header row: source and timestamp
+        self._source_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=fonts.mono_small
+        )
+        self._source_label.grid(row=0, column=0, sticky="w", padx=(10, 0), pady=(8, 4))
+
+        self._ts_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=fonts.mono_small,
             text_color=theme.text_muted
-        ).pack(side="right")
+        )
+        self._ts_label.grid(row=0, column=1, sticky="e", padx=(0, 10), pady=(8, 4))
 
         # Content preview
-        preview = content[:100] + "..." if len(content) > 100 else content
-        preview = preview.replace("\n", " ↵ ")
-
-        ctk.CTkLabel(
+        self._preview_label = ctk.CTkLabel(
             self,
-            text=preview,
-            font=(theme.font_mono, theme.font_size_normal),
+            text="",
+            font=fonts.mono_normal,
             text_color=theme.text_primary,
             anchor="w",
             justify="left"
-        ).pack(fill="x", padx=10, pady=(0, 4))
+        )
+        self._preview_label.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 4))
 
-        # Actions
-        actions = ctk.CTkFrame(self, fg_color="transparent")
-        actions.pack(fill="x", padx=10, pady=(0, 8))
+        # Actions (only when there is something to act on); a row frame only when both buttons exist
+        self._copy_btn = None
+        self._delete_btn = None
+        if on_copy and on_delete:
+            actions = ctk.CTkFrame(self, fg_color="transparent")
+            actions.grid(row=2, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 8))
+        else:
+            actions = self
 
         if on_copy:
-            GlowButton(
+            self._copy_btn = GlowButton(
                 actions, text="COPY", width=60, height=24,
                 command=on_copy
-            ).pack(side="left", padx=(0, 5))
-
+            )
         if on_delete:
-            GlowButton(
+            self._delete_btn = GlowButton(
                 actions, text="DEL", width=50, height=24,
                 accent=theme.accent_red, command=on_delete
-            ).pack(side="left")
+            )
 
+        if on_copy and on_delete:
+            self._copy_btn.pack(side="left", padx=(0, 5))
+            self._delete_btn.pack(side="left")
+        elif on_copy or on_delete:
+            (self._copy_btn or self._delete_btn).grid(
+                row=2, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 8)
+            )
+
+        self._shown_key = None  # (content_hash, timestamp, source) currently displayed
+        self.update_content(content, timestamp, source, on_copy, on_delete, preview, content_hash)
+
+    def update_content(self, content: str, timestamp: str, source: str,
+                       on_copy: Callable[[], None] = None, on_delete: Callable[[], None] = None,
+                       preview: Optional[str] = None, content_hash: Optional[str] = None):
+        """
+        Show a different history item in this card without rebuilding its widgets.
+        Callbacks only rebind buttons that were created in __init__.
+        Does nothing if the card already shows the same item.
+        """
+        key = (content_hash, timestamp, source)
+        if content_hash is not None and key == self._shown_key:
+            return
+        self._shown_key = key
 
+        label_text, source_color = _SOURCE_STYLE.get(source, (f"[{source.upper()}]", theme.text_muted))
+        self._source_label.configure(text=label_text, text_color=source_color)
+        self._ts_label.configure(text=timestamp)
+
+        if preview is None:
+            preview = make_preview(content)
+        self._preview_label.configure(text=preview)
+
+        if self._copy_btn and on_copy:
+            self._copy_btn.configure(command=on_copy)
+        if self._delete_btn and on_delete:
+            self._delete_btn.configure(command=on_delete)
+
+    def destroy(self):
+        # Drop the item callbacks so their captured content is released with the card
+        for btn in (self._copy_btn, self._delete_btn):
+            if btn:
+                btn.configure(command=None)
+        self._copy_btn = self._delete_btn = None
+        super().destroy()
 
 
 class TransferProgressBar(ctk.CTkFrame):
@@ -228,7 +404,7 @@ class TransferProgressBar(ctk.CTkFrame):
         self._filename_label = ctk.CTkLabel(
             top_row,
             text=f"📁 {display_name}",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_primary,
             anchor="w"
         )
@@ -238,7 +414,7 @@ class TransferProgressBar(ctk.CTkFrame):
         self._percent_label = ctk.CTkLabel(
             top_row,
             text="0%",
-            font=(theme.font_mono, theme.font_size_small, "bold"),
+            font=fonts.mono_small_bold,
             text_color=theme.accent_cyan,
             width=50
         )
@@ -251,7 +427,7 @@ class TransferProgressBar(ctk.CTkFrame):
                 text="✖",
                 width=20,
                 height=20,
-                font=(theme.font_mono, 10),
+                font=fonts.mono_small,
                 fg_color="transparent",
                 hover_color=theme.bg_hover,
                 text_color=theme.accent_red,
@@ -269,16 +445,22 @@ class TransferProgressBar(ctk.CTkFrame):
         )
         self._progress_bar.pack(fill="x", pady=(5, 0))
         self._progress_bar.set(0)
+        self._last_pct = -1
 
     def set_progress(self, progress: float):
-        """Update progress (0-100)"""
+        """Update progress (0-100), touching Tk only when the whole percent changes"""
+        pct = round(progress)
+        if pct == self._last_pct:
+            return
+
         self._progress_bar.set(progress / 100)
-        self._percent_label.configure(text=f"{progress:.0f}%")
+        self._percent_label.configure(text=f"{pct}%")
 
-        # Change color based on progress
-        if progress >= 100:
+        # Change color once progress reaches 100%
+        if pct >= 100 > self._last_pct:
             self._progress_bar.configure(progress_color=theme.accent_green)
             self._percent_label.configure(text_color=theme.accent_green)
+        self._last_pct = pct
 
     def set_complete(self):
         """Mark transfer as complete"""
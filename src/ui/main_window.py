@@ -4,17 +4,45 @@ main_window.py - Main application window with geek/terminal styling
 Provides the primary UI for clipboard synchronization
 """
 
+import re
 import customtkinter as ctk
+from collections import deque
 from typing import Callable, Optional
-import pyperclip
 
-from .theme import theme
-from .components import TerminalLog, StatusIndicator, GlowButton, ClipboardCard, TransferProgressBar
+from .theme import theme, fonts
+from .components import TerminalLog, StatusIndicator, StatusModel, GlowButton, ClipboardCard, TransferProgressBar
 
 
+# Tunnel state implied by the server URL: (status, header label, detail label)
+_URL_CLASSIFIER = re.compile(r"(trycloudflare\.com)|(localhost|127\.0\.0\.1)")
+_URL_STATES = (
+    ("online", "Tunnel: ON", "Tunnel: Connected"),
+    ("connecting", "Tunnel: ...", "Tunnel: Connecting..."),
+    ("waiting", "Tunnel: LAN", "Tunnel: LAN only"),
+)
+
+# Client count noun, indexed by count == 1
+_PLURAL = ("clients", "client")
+
 class MainWindow(ctk.CTk):
     """Main application window with tabbed interface"""
-    
+
+    # Delay and order for coalesced UI updates (see _schedule_ui)
+    _UI_FLUSH_DELAY_MS = 30
+    _UI_APPLY_ORDER = (
+        ('client_count', '_apply_client_count'),
+        ('tunnel', '_apply_tunnel_status'),
+        ('history', '_apply_history'),
+        ('sync', '_apply_sync_activity'),
+    )
+
+    # Tabs built on first view; SERVER/CLIENT hold connection state and are built eagerly
+    _LAZY_TABS = {
+        "  TRANSFERS  ": '_create_transfer_tab',
+        "  HISTORY  ": '_create_history_tab',
+        "  LOGS  ": '_create_logs_tab',
+    }
+
     def __init__(
         self,
         on_start_server: Callable[[], None] = None,
@@ -48,6 +76,11 @@ class MainWindow(ctk.CTk):
         ctk.set_default_color_theme("dark-blue")
         self.configure(fg_color=theme.bg_dark)
 
+        # Shared status models, each shown in the header and in its tab
+        self._server_model = StatusModel()
+        self._tunnel_model = StatusModel()
+        self._client_model = StatusModel()
+
         # Build UI
         self._create_header()
         self._create_transfer_panel()  # Add transfer panel
@@ -55,37 +88,44 @@ class MainWindow(ctk.CTk):
         self._create_footer()
 
         # State
+        self._pending: dict = {}  # Coalesced UI updates, see _schedule_ui
+        self._flush_scheduled = False
         self._server_running = False
         self._client_connected = False
         self._client_connecting = False  # True when connecting or reconnecting
+        self._sync_reset_id = None  # Pending "Sync: Ready" reset, see _apply_sync_activity
+        self._client_count = 0  # Count shown in _clients_label
     
     def _create_header(self):
         """Create header with title and status"""
         header = ctk.CTkFrame(self, fg_color=theme.bg_medium, height=60)
         header.pack(fill="x", padx=0, pady=0)
-        header.pack_propagate(False)
+        header.grid_propagate(False)
+        # Title on the left, indicators on the right, spacer column between
+        header.grid_rowconfigure(0, weight=1)
+        header.grid_columnconfigure(1, weight=1)
         
         # ASCII art title
         title = ctk.CTkLabel(
             header,
             text="⚡ COPY.PASTE.EVERYTHING",
-            font=(theme.font_mono, theme.font_size_title, "bold"),
+            font=fonts.mono_title_bold,
             text_color=theme.accent_green
         )
-        title.pack(side="left", padx=20, pady=15)
+        title.grid(row=0, column=0, sticky="w", padx=20)
         
         # Status indicators
-        status_frame = ctk.CTkFrame(header, fg_color="transparent")
-        status_frame.pack(side="right", padx=20)
+        self._tunnel_status = StatusIndicator(header, "Tunnel: -")
+        self._tunnel_status.attach(self._tunnel_model)
+        self._tunnel_status.grid(row=0, column=2, sticky="e", padx=(0, 15))
 
-        self._tunnel_status = StatusIndicator(status_frame, "Tunnel: -")
-        self._tunnel_status.pack(side="left", padx=(0, 15))
+        self._server_status = StatusIndicator(header, "Server: OFF")
+        self._server_status.attach(self._server_model)
+        self._server_status.grid(row=0, column=3, sticky="e", padx=(0, 15))
 
-        self._server_status = StatusIndicator(status_frame, "Server: OFF")
-        self._server_status.pack(side="left", padx=(0, 15))
-
-        self._client_status = StatusIndicator(status_frame, "Client: OFF")
-        self._client_status.pack(side="left")
+        self._client_status = StatusIndicator(header, "Client: OFF")
+        self._client_status.attach(self._client_model)
+        self._client_status.grid(row=0, column=4, sticky="e", padx=(0, 20))
 
     def _create_transfer_panel(self):
         """Create transfer tab - will be called after tabs are created"""
@@ -118,14 +158,27 @@ class MainWindow(ctk.CTk):
         # Apply initial tab text colors (selected=black, unselected=white)
         self._update_tab_text_colors()
 
+        # Placeholders until the lazy tabs are built, see _ensure_tab
+        self._tabs_built: set = set()
+        self._transfer_bars: dict = {}  # transfer_id -> TransferProgressBar
+        self._history_frame = None
+        self._history_rows: list = []
+        self._log_display = None
+        self._log_backlog: deque = deque(maxlen=500)
+
         self._create_server_tab()
         self._create_client_tab()
-        self._create_transfer_tab()
-        self._create_history_tab()
-        self._create_logs_tab()
+
+    def _ensure_tab(self, name: str):
+        """Build a lazy tab's widgets the first time it is needed"""
+        builder = self._LAZY_TABS.get(name)
+        if builder and name not in self._tabs_built:
+            self._tabs_built.add(name)
+            getattr(self, builder)()
 
     def _on_tab_changed(self):
-        """Handle tab change event to update text colors"""
+        """Handle tab change event to build the tab and update text colors"""
+        self._ensure_tab(self._tabview.get())
         self._update_tab_text_colors()
 
     def _update_tab_text_colors(self):
@@ -156,14 +209,14 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             info_frame,
             text="// SERVER MODE",
-            font=(theme.font_mono, theme.font_size_large, "bold"),
+            font=fonts.mono_large_bold,
             text_color=theme.accent_cyan
         ).pack(anchor="w", padx=15, pady=(15, 5))
         
         ctk.CTkLabel(
             info_frame,
             text="Start a server to sync clipboard with connected clients",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_secondary
         ).pack(anchor="w", padx=15, pady=(0, 15))
         
@@ -174,7 +227,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             url_frame,
             text="CONNECTION URL:",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_muted
         ).pack(anchor="w", padx=15, pady=(10, 5))
         
@@ -182,7 +235,7 @@ class MainWindow(ctk.CTk):
         self._server_url_entry = ctk.CTkEntry(
             url_frame,
             textvariable=self._server_url_var,
-            font=(theme.font_mono, theme.font_size_normal),
+            font=fonts.mono_normal,
             fg_color=theme.bg_dark,
             text_color=theme.accent_green,
             border_color=theme.border_default,
@@ -203,26 +256,25 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             status_panel,
             text="STATUS:",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_muted
-        ).pack(anchor="w", padx=15, pady=(10, 5))
-
-        status_row = ctk.CTkFrame(status_panel, fg_color="transparent")
-        status_row.pack(fill="x", padx=15, pady=(0, 10))
+        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=15, pady=(10, 5))
 
-        self._server_detail_status = StatusIndicator(status_row, "Server: Stopped")
-        self._server_detail_status.pack(side="left", padx=(0, 20))
+        self._server_detail_status = StatusIndicator(status_panel, "Server: Stopped")
+        self._server_detail_status.attach(self._server_model, detail=True)
+        self._server_detail_status.grid(row=1, column=0, sticky="w", padx=(15, 20), pady=(0, 10))
 
-        self._tunnel_detail_status = StatusIndicator(status_row, "Tunnel: Not active")
-        self._tunnel_detail_status.pack(side="left", padx=(0, 20))
+        self._tunnel_detail_status = StatusIndicator(status_panel, "Tunnel: Not active")
+        self._tunnel_detail_status.attach(self._tunnel_model, detail=True)
+        self._tunnel_detail_status.grid(row=1, column=1, sticky="w", padx=(0, 20), pady=(0, 10))
 
         self._clients_label = ctk.CTkLabel(
-            status_row,
+            status_panel,
             text="👥 0 clients",
-            font=(theme.font_mono, theme.font_size_normal),
+            font=fonts.mono_normal,
             text_color=theme.text_secondary
         )
-        self._clients_label.pack(side="left")
+        self._clients_label.grid(row=1, column=2, sticky="w", pady=(0, 10))
 
         # Controls
         controls = ctk.CTkFrame(tab, fg_color="transparent")
@@ -245,14 +297,14 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             info_frame,
             text="// CLIENT MODE",
-            font=(theme.font_mono, theme.font_size_large, "bold"),
+            font=fonts.mono_large_bold,
             text_color=theme.accent_purple
         ).pack(anchor="w", padx=15, pady=(15, 5))
 
         ctk.CTkLabel(
             info_frame,
             text="Connect to a server to sync clipboard",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_secondary
         ).pack(anchor="w", padx=15, pady=(0, 15))
 
@@ -263,7 +315,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             url_frame,
             text="SERVER URL:",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_muted
         ).pack(anchor="w", padx=15, pady=(10, 5))
 
@@ -271,7 +323,7 @@ class MainWindow(ctk.CTk):
         self._client_url_entry = ctk.CTkEntry(
             url_frame,
             textvariable=self._client_url_var,
-            font=(theme.font_mono, theme.font_size_normal),
+            font=fonts.mono_normal,
             fg_color=theme.bg_dark,
             text_color=theme.accent_green,
             border_color=theme.border_default,
@@ -287,18 +339,16 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             status_panel,
             text="STATUS:",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_muted
-        ).pack(anchor="w", padx=15, pady=(10, 5))
-
-        status_row = ctk.CTkFrame(status_panel, fg_color="transparent")
-        status_row.pack(fill="x", padx=15, pady=(0, 10))
+        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=15, pady=(10, 5))
 
-        self._client_detail_status = StatusIndicator(status_row, "Connection: Not connected")
-        self._client_detail_status.pack(side="left", padx=(0, 20))
+        self._client_detail_status = StatusIndicator(status_panel, "Connection: Not connected")
+        self._client_detail_status.attach(self._client_model, detail=True)
+        self._client_detail_status.grid(row=1, column=0, sticky="w", padx=(15, 20), pady=(0, 10))
 
-        self._sync_status = StatusIndicator(status_row, "Sync: Idle")
-        self._sync_status.pack(side="left")
+        self._sync_status = StatusIndicator(status_panel, "Sync: Idle")
+        self._sync_status.grid(row=1, column=1, sticky="w", pady=(0, 10))
 
         # Controls
         controls = ctk.CTkFrame(tab, fg_color="transparent")
@@ -322,14 +372,14 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="// FILE TRANSFERS",
-            font=(theme.font_mono, theme.font_size_large, "bold"),
+            font=fonts.mono_large_bold,
             text_color=theme.accent_cyan
         ).pack(side="left")
 
         self._transfer_count_label = ctk.CTkLabel(
             header,
             text="",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_muted
         )
         self._transfer_count_label.pack(side="right")
@@ -338,7 +388,7 @@ class MainWindow(ctk.CTk):
         self._transfer_empty_label = ctk.CTkLabel(
             tab,
             text="No active transfers\n\nFile transfers will appear here when\nyou copy large files between devices",
-            font=(theme.font_mono, theme.font_size_normal),
+            font=fonts.mono_normal,
             text_color=theme.text_muted,
             justify="center"
         )
@@ -351,8 +401,7 @@ class MainWindow(ctk.CTk):
             corner_radius=theme.corner_radius
         )
 
-        # Transfer progress bars storage
-        self._transfer_bars: dict = {}  # transfer_id -> TransferProgressBar
+        self._transfer_list_visible = False
 
     def _create_history_tab(self):
         """Create history tab"""
@@ -365,7 +414,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="// CLIPBOARD HISTORY",
-            font=(theme.font_mono, theme.font_size_large, "bold"),
+            font=fonts.mono_large_bold,
             text_color=theme.accent_orange
         ).pack(side="left")
 
@@ -383,7 +432,9 @@ class MainWindow(ctk.CTk):
         )
         self._history_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-        self._history_cards = []
+        self._history_cards: dict = {}  # content_hash -> ClipboardCard
+        self._history_displayed: list = []  # content hashes in packed order
+        self._apply_history(self._history_rows)
 
     def _create_logs_tab(self):
         """Create logs tab"""
@@ -396,7 +447,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="// SYSTEM LOGS",
-            font=(theme.font_mono, theme.font_size_large, "bold"),
+            font=fonts.mono_large_bold,
             text_color=theme.text_secondary
         ).pack(side="left")
 
@@ -409,6 +460,11 @@ class MainWindow(ctk.CTk):
         self._log_display = TerminalLog(tab)
         self._log_display.pack(fill="both", expand=True, padx=10, pady=5)
 
+        # Replay messages logged before the tab was first shown
+        for message in self._log_backlog:
+            self._log_display.append(message)
+        self._log_backlog.clear()
+
     def _create_footer(self):
         """Create footer with version info"""
         footer = ctk.CTkFrame(self, fg_color=theme.bg_medium, height=30)
@@ -418,7 +474,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             footer,
             text="v1.0.0 | Lightweight Clipboard Sync",
-            font=(theme.font_mono, theme.font_size_small),
+            font=fonts.mono_small,
             text_color=theme.text_muted
         ).pack(side="left", padx=15, pady=5)
 
@@ -426,7 +482,10 @@ class MainWindow(ctk.CTk):
         """Copy server URL to clipboard"""
         url = self._server_url_var.get()
         if url and url != "Not running":
-            pyperclip.copy(url)
+            # Tk's own clipboard; it is served by the event loop while the window is open
+            self.clipboard_clear()
+            self.clipboard_append(url)
+            self.update_idletasks()
             self.log("URL copied to clipboard")
 
     def _toggle_server(self):
@@ -446,105 +505,172 @@ class MainWindow(ctk.CTk):
             if url and url != "ws://":
                 self._on_connect(url)
 
+    # Coalesced UI updates: setters record the latest value, one flush applies them all
+    def _schedule_ui(self, key: str, args: tuple):
+        """Record a pending UI update and schedule a single flush"""
+        self._pending[key] = args
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(self._UI_FLUSH_DELAY_MS, self._flush_ui)
+
+    def _discard_pending(self, key: str):
+        """Drop a queued update superseded by an immediate state change"""
+        self._pending.pop(key, None)
+
+    def _flush_ui(self):
+        """Apply all pending UI updates in one pass"""
+        # Swap out first, so setters called while applying schedule a new flush
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        for key, method in self._UI_APPLY_ORDER:
+            if key in pending:
+                getattr(self, method)(*pending[key])
+
     # Public methods for updating UI state
     def log(self, message: str):
         """Add message to log display"""
-        self._log_display.append(message)
+        if self._log_display is None:
+            self._log_backlog.append(message)
+        else:
+            self._log_display.append(message)
 
     def set_server_running(self, running: bool, url: str = ""):
         """Update server status"""
         self._server_running = running
+        if url or not running:
+            self._discard_pending('tunnel')  # Tunnel state is set below
         if running:
-            self._server_status.set_status("online", "Server: ON")
-            self._server_detail_status.set_status("online", "Server: Running")
+            self._server_model.set("online", "Server: ON", "Server: Running")
             self._start_server_btn.configure(text="■ STOP SERVER")
             if url:
                 self._server_url_var.set(url)
                 # Update tunnel status based on URL
-                if "trycloudflare.com" in url:
-                    self._tunnel_status.set_status("online", "Tunnel: ON")
-                    self._tunnel_detail_status.set_status("online", "Tunnel: Connected")
-                elif "localhost" in url or "127.0.0.1" in url:
-                    self._tunnel_status.set_status("connecting", "Tunnel: ...")
-                    self._tunnel_detail_status.set_status("connecting", "Tunnel: Connecting...")
-                else:
-                    self._tunnel_status.set_status("waiting", "Tunnel: LAN")
-                    self._tunnel_detail_status.set_status("waiting", "Tunnel: LAN only")
+                m = _URL_CLASSIFIER.search(url)
+                status, short_label, long_label = _URL_STATES[0 if m and m.group(1) else 1 if m else 2]
+                self._tunnel_model.set(status, short_label, long_label)
         else:
-            self._server_status.set_status("offline", "Server: OFF")
-            self._server_detail_status.set_status("offline", "Server: Stopped")
-            self._tunnel_status.set_status("offline", "Tunnel: -")
-            self._tunnel_detail_status.set_status("offline", "Tunnel: Not active")
+            self._server_model.set("offline", "Server: OFF", "Server: Stopped")
+            self._tunnel_model.set("offline", "Tunnel: -", "Tunnel: Not active")
             self._start_server_btn.configure(text="▶ START SERVER")
             self._server_url_var.set("Not running")
 
     def set_tunnel_status(self, status: str, label: str):
-        """Update tunnel status indicator"""
-        self._tunnel_status.set_status(status, label)
-        self._tunnel_detail_status.set_status(status, label)
+        """Update tunnel status indicator (applied on the next UI flush)"""
+        self._schedule_ui('tunnel', (status, label))
+
+    def _apply_tunnel_status(self, status: str, label: str):
+        self._tunnel_model.set(status, label)
 
     def set_client_connected(self, connected: bool):
         """Update client status"""
+        self._discard_pending('sync')
         self._client_connected = connected
         self._client_connecting = False  # No longer connecting
         if connected:
-            self._client_status.set_status("online", "Client: ON")
-            self._client_detail_status.set_status("online", "Connection: Connected")
+            self._client_model.set("online", "Client: ON", "Connection: Connected")
             self._sync_status.set_status("online", "Sync: Ready")
             self._connect_btn.configure(text="✖ DISCONNECT")
         else:
-            self._client_status.set_status("offline", "Client: OFF")
-            self._client_detail_status.set_status("offline", "Connection: Disconnected")
+            self._client_model.set("offline", "Client: OFF", "Connection: Disconnected")
             self._sync_status.set_status("offline", "Sync: Idle")
             self._connect_btn.configure(text="🔗 CONNECT")
 
     def set_client_connecting(self):
         """Set client to connecting state"""
+        self._discard_pending('sync')
         self._client_connecting = True
-        self._client_status.set_status("connecting", "Client: ...")
-        self._client_detail_status.set_status("connecting", "Connection: Connecting...")
+        self._client_model.set("connecting", "Client: ...", "Connection: Connecting...")
         self._sync_status.set_status("waiting", "Sync: Waiting")
         self._connect_btn.configure(text="✖ CANCEL")
 
     def set_client_reconnecting(self):
         """Set client to reconnecting state - allows user to cancel"""
+        self._discard_pending('sync')
         self._client_connected = False
         self._client_connecting = True  # Still trying to connect
-        self._client_status.set_status("connecting", "Client: ...")
-        self._client_detail_status.set_status("connecting", "Connection: Reconnecting...")
+        self._client_model.set("connecting", "Client: ...", "Connection: Reconnecting...")
         self._sync_status.set_status("waiting", "Sync: Waiting")
         self._connect_btn.configure(text="✖ CANCEL")
 
     def show_sync_activity(self):
-        """Flash sync indicator to show activity"""
+        """Flash sync indicator to show activity (applied on the next UI flush)"""
+        self._schedule_ui('sync', ())
+
+    def _apply_sync_activity(self):
         self._sync_status.set_status("syncing", "Sync: Syncing...")
-        # Reset after 1 second
-        self.after(1000, lambda: self._sync_status.set_status("online", "Sync: Ready")
-                   if self._client_connected else None)
+        # Reset 1 second after the last activity, keeping a single pending timer
+        if self._sync_reset_id:
+            self.after_cancel(self._sync_reset_id)
+        self._sync_reset_id = self.after(1000, self._reset_sync_indicator)
+
+    def _reset_sync_indicator(self):
+        """Return the sync indicator to ready once activity stops"""
+        self._sync_reset_id = None
+        if self._client_connected:
+            self._sync_status.set_status("online", "Sync: Ready")
 
     def set_client_count(self, count: int):
-        """Update connected clients count"""
-        self._clients_label.configure(text=f"👥 {count} client{'s' if count != 1 else ''}")
-
-    def update_history(self, items: list):
-        """Update history display"""
-        # Clear existing cards
-        for card in self._history_cards:
-            card.destroy()
-        self._history_cards.clear()
-
-        # Create new cards
-        for item in items:
-            card = ClipboardCard(
-                self._history_frame,
-                content=item.content,
-                timestamp=item.timestamp.strftime("%H:%M:%S"),
-                source=item.source,
-                on_copy=lambda c=item.content: self._copy_history_item(c),
-                on_delete=lambda h=item.content_hash: self._delete_history_item(h)
-            )
-            card.pack(fill="x", padx=5, pady=3)
-            self._history_cards.append(card)
+        """Update connected clients count (applied on the next UI flush)"""
+        self._schedule_ui('client_count', (count,))
+
+    def _apply_client_count(self, count: int):
+        if count == self._client_count:
+            return
+        self._client_count = count
+        self._clients_label.configure(text=f"👥 {count} {_PLURAL[count == 1]}")
+
+    def update_history(self, rows: list):
+        """Update history display from HistoryRow tuples (applied on the next UI flush)"""
+        self._schedule_ui('history', (rows,))
+
+    def _apply_history(self, rows: list):
+        """Diff history rows against the displayed cards, touching only what changed"""
+        self._history_rows = rows
+        if self._history_frame is None:
+            return  # Rendered when the tab is first shown
+
+        # Remove cards whose items are gone
+        new_hashes = [row.hash for row in rows]
+        keep = set(new_hashes)
+        for h in [h for h in self._history_cards if h not in keep]:
+            self._history_cards.pop(h).destroy()
+        remaining = [h for h in self._history_displayed if h in keep]
+
+        # Walk the new order; cards already in sequence stay put, others are (re)packed after prev
+        moved = set()
+        j = 0
+        prev = None
+        for row in rows:
+            card = self._history_cards.get(row.hash)
+            if card is None:
+                card = ClipboardCard(
+                    self._history_frame, row.content, row.ts_str, row.source,
+                    on_copy=lambda c=row.content: self._copy_history_item(c),
+                    on_delete=lambda h=row.hash: self._delete_history_item(h),
+                    preview=row.preview,
+                    content_hash=row.hash
+                )
+                self._history_cards[row.hash] = card
+            else:
+                # Callbacks only depend on the hash, so just refresh the displayed fields
+                card.update_content(row.content, row.ts_str, row.source,
+                                    preview=row.preview, content_hash=row.hash)
+
+            while j < len(remaining) and remaining[j] in moved:
+                j += 1
+            if j < len(remaining) and remaining[j] == row.hash:
+                j += 1  # Already in place
+            else:
+                moved.add(row.hash)
+                if prev is None and remaining:
+                    card.pack(fill="x", padx=5, pady=3, before=self._history_cards[remaining[0]])
+                elif prev is None:
+                    card.pack(fill="x", padx=5, pady=3)
+                else:
+                    card.pack(fill="x", padx=5, pady=3, after=prev)
+            prev = card
+
+        self._history_displayed = new_hashes
 
     def _copy_history_item(self, content: str):
         """Copy history item to clipboard"""
@@ -560,19 +686,23 @@ class MainWindow(ctk.CTk):
     def _update_transfer_ui(self):
         """Update transfer list visibility and count"""
         count = len(self._transfer_bars)
-        if count > 0:
-            self._transfer_empty_label.pack_forget()
-            self._transfer_list.pack(fill="both", expand=True, padx=10, pady=5)
-            self._transfer_count_label.configure(text=f"({count} active)")
-        else:
-            self._transfer_list.pack_forget()
-            self._transfer_empty_label.pack(expand=True)
-            self._transfer_count_label.configure(text="")
+        visible = count > 0
+        if visible != self._transfer_list_visible:
+            # Only re-pack when switching between the list and the empty state
+            self._transfer_list_visible = visible
+            if visible:
+                self._transfer_empty_label.pack_forget()
+                self._transfer_list.pack(fill="both", expand=True, padx=10, pady=5)
+            else:
+                self._transfer_list.pack_forget()
+                self._transfer_empty_label.pack(expand=True)
+        self._transfer_count_label.configure(text=f"({count} active)" if visible else "")
 
     def add_transfer(self, transfer_id: str, filename: str, direction: str = "upload"):
         """Add a new transfer to the progress tab"""
         if transfer_id in self._transfer_bars:
             return
+        self._ensure_tab("  TRANSFERS  ")
 
         progress_bar = TransferProgressBar(
             self._transfer_list,
@@ -587,8 +717,9 @@ class MainWindow(ctk.CTk):
 
     def update_transfer_progress(self, transfer_id: str, progress: float):
         """Update progress for a transfer (0-100)"""
-        if transfer_id in self._transfer_bars:
-            self._transfer_bars[transfer_id].set_progress(progress)
+        bar = self._transfer_bars.get(transfer_id)
+        if bar:
+            bar.set_progress(progress)
 
     def complete_transfer(self, transfer_id: str):
         """Mark a transfer as complete and remove after delay"""
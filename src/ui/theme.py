@@ -4,6 +4,7 @@ theme.py - Geek/Hacker style theme configuration
 Defines colors, fonts, and styling for the terminal-like UI
 """
 
+import customtkinter as ctk
 from dataclasses import dataclass
 from typing import Tuple
 
@@ -54,6 +55,41 @@ class GeekTheme:
 # Global theme instance
 theme = GeekTheme()
 
+# Shared font specs so widgets don't rebuild the same tuples
+FONT_MONO_SMALL = (theme.font_mono, theme.font_size_small)
+FONT_MONO_SMALL_BOLD = (theme.font_mono, theme.font_size_small, "bold")
+FONT_MONO_NORMAL = (theme.font_mono, theme.font_size_normal)
+FONT_MONO_NORMAL_BOLD = (theme.font_mono, theme.font_size_normal, "bold")
+FONT_MONO_LARGE_BOLD = (theme.font_mono, theme.font_size_large, "bold")
+FONT_MONO_TITLE_BOLD = (theme.font_mono, theme.font_size_title, "bold")
+
+
+class _SharedFonts:
+    """Shared CTkFont objects, created on first access (they need a Tk root)"""
+
+    _SPECS = {
+        "mono_small": FONT_MONO_SMALL,
+        "mono_small_bold": FONT_MONO_SMALL_BOLD,
+        "mono_normal": FONT_MONO_NORMAL,
+        "mono_normal_bold": FONT_MONO_NORMAL_BOLD,
+        "mono_large": (theme.font_mono, theme.font_size_large),
+        "mono_large_bold": FONT_MONO_LARGE_BOLD,
+        "mono_title_bold": FONT_MONO_TITLE_BOLD,
+    }
+
+    def __getattr__(self, name: str) -> ctk.CTkFont:
+        try:
+            family, size, *style = self._SPECS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        font = ctk.CTkFont(family=family, size=size, weight=style[0] if style else "normal")
+        setattr(self, name, font)  # Cached; later lookups skip __getattr__
+        return font
+
+
+# Shared fonts, e.g. font=fonts.mono_normal
+fonts = _SharedFonts()
+
 
 # CustomTkinter color configurations
 CTK_COLORS = {